@@ -34,6 +34,9 @@ class DiscoveryAppln:
         self.reg_broker = None  # Store broker information
         self.ready = False
         self.mw = None  # Middleware object
+        self.registry_version = 0  # Bumped on every registry mutation
+        self.resp_cache = {}  # (msg_type, topics) -> prebuilt DiscoveryResp
+        self.resp_cache_version = 0  # Registry version the cache was built against
 
     def configure(self, args):
         """Configure the discovery application."""
@@ -111,6 +114,7 @@ class DiscoveryAppln:
                 response.reason = "Invalid role"
                 return response
 
+            self.registry_version += 1
             self.check_ready_state()
 
             response = discovery_pb2.DiscoveryResp()
@@ -129,9 +133,15 @@ class DiscoveryAppln:
         """Handle is_ready requests."""
         try:
             self.logger.debug("DiscoveryAppln::handle_is_ready")
+            key = (discovery_pb2.TYPE_ISREADY, None)
+            response = self.get_cached_response(key)
+            if response is not None:
+                return response
+
             response = discovery_pb2.DiscoveryResp()
             response.msg_type = discovery_pb2.TYPE_ISREADY
             response.isready_resp.status = self.ready
+            self.resp_cache[key] = response
             return response
         except Exception as e:
             self.logger.error(f"DiscoveryAppln::handle_is_ready - Exception: {e}")
@@ -144,6 +154,10 @@ class DiscoveryAppln:
         """Handle lookup requests."""
         try:
             self.logger.debug(f"DiscoveryAppln::handle_lookup - Topics Requested: {lookup_req.topiclist}")
+            key = (discovery_pb2.TYPE_LOOKUP_PUB_BY_TOPIC, frozenset(lookup_req.topiclist))
+            response = self.get_cached_response(key)
+            if response is not None:
+                return response
 
             # If a broker is registered, return its address
             if self.reg_broker:
@@ -158,12 +172,14 @@ class DiscoveryAppln:
                 broker_info.addr = self.reg_broker["addr"]
                 broker_info.port = self.reg_broker["port"]
 
+                self.resp_cache[key] = response
                 return response
             else:
                 self.logger.error("No broker registered")
                 response = discovery_pb2.DiscoveryResp()
                 response.msg_type = discovery_pb2.TYPE_LOOKUP_PUB_BY_TOPIC
                 response.lookup_resp.status = discovery_pb2.STATUS_FAILURE
+                self.resp_cache[key] = response
                 return response
         except Exception as e:
             self.logger.error(f"DiscoveryAppln::handle_lookup - Exception: {e}")
@@ -176,6 +192,10 @@ class DiscoveryAppln:
         """Handle broker lookup requests from publishers."""
         try:
             self.logger.debug("DiscoveryAppln::handle_broker_lookup")
+            key = (discovery_pb2.TYPE_LOOKUP_BROKER, None)
+            response = self.get_cached_response(key)
+            if response is not None:
+                return response
 
             response = discovery_pb2.DiscoveryResp()
             response.msg_type = discovery_pb2.TYPE_LOOKUP_BROKER
@@ -190,6 +210,7 @@ class DiscoveryAppln:
                 response.lookup_broker_resp.status = discovery_pb2.STATUS_FAILURE
                 self.logger.error("No broker registered for lookup")
 
+            self.resp_cache[key] = response
             return response
         except Exception as e:
             self.logger.error(f"DiscoveryAppln::handle_broker_lookup - Exception: {e}")
@@ -198,6 +219,14 @@ class DiscoveryAppln:
             response.lookup_broker_resp.status = discovery_pb2.STATUS_FAILURE
             return response
 
+    def get_cached_response(self, key):
+        """Return a prebuilt response for key, or None if the registry changed since it was built."""
+        if self.resp_cache_version != self.registry_version:
+            self.resp_cache.clear()
+            self.resp_cache_version = self.registry_version
+            return None
+        return self.resp_cache.get(key)
+
     def check_ready_state(self):
         """Check if the discovery service is ready."""
         if len(self.reg_pubs) >= self.pub_count and len(self.reg_subs) >= self.sub_count and self.reg_broker: